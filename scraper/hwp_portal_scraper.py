@@ -5,52 +5,175 @@ HWP Planning Portal Scraper
 Scrapes Irish planning authority portals for application status updates.
 Supports two portal types:
   1. Agile Applications Citizen Portal (Cork County, Cork City) -- AngularJS SPA
-     Uses Playwright headless browser to render the SPA and extract data
-     from Angular scope objects.
+     Searches the portal's JSON API directly, falling back to a Playwright
+     headless browser that renders the SPA and reads Angular scope objects.
+     Detail pages are always rendered with Playwright.
   2. ePlanning.ie (Limerick) -- Server-rendered HTML
-     Uses requests + BeautifulSoup for fast, lightweight scraping.
+     Uses httpx (or requests) + BeautifulSoup (lxml parser) for fast,
+     lightweight scraping.
 
 Each authority can have a primary and fallback portal URL to handle
 the ongoing transition between portal systems.
 
 Installation:
-  pip install playwright beautifulsoup4 requests
+  pip install playwright beautifulsoup4 lxml requests
   playwright install chromium
+  pip install "httpx[http2]"                     # Optional, HTTP/2 for ePlanning
+  pip install pyahocorasick                      # Optional, faster status matching
+  pip install pyarrow                            # Optional, for --output parquet
 
 Usage:
   python hwp_portal_scraper.py                    # Check all tracked applications
   python hwp_portal_scraper.py --ref 25/6796      # Check a specific application
   python hwp_portal_scraper.py --output json       # Output as JSON
   python hwp_portal_scraper.py --output csv        # Output as CSV
+  python hwp_portal_scraper.py --output parquet    # Write a typed results table
   python hwp_portal_scraper.py --active-only       # Skip granted/invalid apps
+  python hwp_portal_scraper.py --workers 2         # Limit concurrent browser contexts
+  python hwp_portal_scraper.py --force-refresh     # Ignore cached portal data
+
+Set HWP_SCRAPER_CDP_URL (e.g. http://127.0.0.1:9222) to share one browser
+started by launch_shared_browser.py instead of launching one per process.
 """
 
+import csv
 import json
+import logging
+import os
+import queue
 import re
+import shutil
 import sys
+import tempfile
 import argparse
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import cache, lru_cache
+from urllib.parse import urlparse
 
 # Optional imports -- graceful fallback if not installed
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import httpx
+    HAS_HTTPX = True
+    try:
+        import h2  # noqa: F401 -- only needed for httpx's HTTP/2 support
+        HAS_H2 = True
+    except ImportError:
+        HAS_H2 = False
+except ImportError:
+    HAS_HTTPX = False
+    HAS_H2 = False
+
 try:
     from bs4 import BeautifulSoup
     HAS_BS4 = True
 except ImportError:
     HAS_BS4 = False
 
+try:
+    import lxml  # noqa: F401 -- only used as the BeautifulSoup parser backend
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
 try:
     from playwright.sync_api import sync_playwright
     HAS_PLAYWRIGHT = True
 except ImportError:
     HAS_PLAYWRIGHT = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import fcntl  # POSIX only -- locks browser profiles across scraper processes
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+
+log = logging.getLogger("hwp_scraper")
+
+
+class _BatchedStderrHandler(logging.Handler):
+    """
+    Buffers log records per thread and writes each thread's batch to stderr
+    in a single call.
+
+    Worker threads check applications concurrently, so each thread's lines
+    are held until its current application is done (see flush_log()) and
+    then written as one block. Progress appears one application at a time,
+    and lines from different workers don't interleave. A thread that logs
+    more than `capacity` records in one go is flushed early, and close()
+    (run by logging.shutdown() at exit) writes anything still pending.
+    """
+
+    def __init__(self, capacity=64):
+        super().__init__()
+        self.capacity = capacity
+        self._buffers = {}  # thread ident -> pending records
+
+    def emit(self, record):
+        buffer = self._buffers.setdefault(threading.get_ident(), [])
+        buffer.append(record)
+        if len(buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        """Write the calling thread's pending records as one block."""
+        with self.lock:
+            self._write(self._buffers.pop(threading.get_ident(), None))
+
+    def close(self):
+        with self.lock:
+            for records in self._buffers.values():
+                self._write(records)
+            self._buffers.clear()
+        super().close()
+
+    def _write(self, records):
+        if records:
+            sys.stderr.write("".join(self.format(record) + "\n" for record in records))
+            sys.stderr.flush()
+
+
+def configure_logging():
+    """Route the scraper's log output to stderr, unadorned, in per-thread batches."""
+    handler = _BatchedStderrHandler(capacity=64)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def flush_log():
+    """Write out the calling thread's buffered log lines, e.g. once per application."""
+    for handler in log.handlers:
+        handler.flush()
+
+
+# Browser-like User-Agent shared by the ePlanning session and Playwright contexts
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
 
 # =============================================================================
 # PORTAL REGISTRY
@@ -65,6 +188,8 @@ PORTAL_REGISTRY = {
             "type": "agile",
             "base_url": "https://planning.agileapplications.ie/corkcoco",
             "api_url": "https://planningapi.agileapplications.ie",
+            "search_path": "/api/application/search",
+            "client": "CORKCOCO",
             "identity_url": "https://identity.agileapplications.ie",
         },
         "fallback": None,
@@ -75,6 +200,8 @@ PORTAL_REGISTRY = {
             "type": "agile",
             "base_url": "https://planning.agileapplications.ie/corkcity",
             "api_url": "https://planningapi.agileapplications.ie",
+            "search_path": "/api/application/search",
+            "client": "CORKCITY",
             "identity_url": "https://identity.agileapplications.ie",
         },
         "fallback": None,
@@ -92,24 +219,24 @@ PORTAL_REGISTRY = {
 }
 
 
-# Status mapping: normalise portal status strings to dashboard status values
+# Status mapping: normalise portal status strings to dashboard status values.
+# Order is priority: the first key found anywhere in the string wins, so
+# specific keys sit above any shorter key they contain.
 STATUS_MAP = {
     # Agile Applications statuses (from scope.row.status)
     "further information": "Further Information Requested",
-    "further information requested": "Further Information Requested",
     "new application": "New Application",
+    "new app": "New Application",
     "new": "New Application",
     "decision made": "Decision Made",
-    "grant": "Final Grant Issued",
     "grant permission": "Final Grant Issued",
     "grant with conditions": "Decision Made",
-    "refuse": "Decision Made",
+    "grant": "Final Grant Issued",
     "refuse permission": "Decision Made",
+    "refuse": "Decision Made",
     "invalid": "Invalid",
     "withdrawn": "Invalid",
     # ePlanning.ie statuses (from HTML table)
-    "new app": "New Application",
-    "new application": "New Application",
     "fi requested": "Further Information Requested",
     "fi received": "Further Information Requested",
     "decided": "Decision Made",
@@ -118,45 +245,95 @@ STATUS_MAP = {
     "permission c": "Final Grant Issued",
     "permission": "Final Grant Issued",
     "refused": "Decision Made",
-    "refuse permission": "Decision Made",
     "retention": "New Application",
 }
 
+# Dashboard statuses an application never moves on from
+TERMINAL_STATES = frozenset({"Final Grant Issued", "Invalid"})
+
+
+# Of all STATUS_MAP keys found in the string, the one earliest in
+# STATUS_MAP wins, as in a plain "for key in STATUS_MAP: if key in s" loop.
+# With pyahocorasick installed this is one automaton scan; otherwise one
+# compiled regex alternation in STATUS_MAP order, wrapped in a lookahead so
+# keys that start inside another match are still seen. Group k{i} is the
+# key at priority i.
+if HAS_AHOCORASICK:
+    _STATUS_AUTOMATON = ahocorasick.Automaton()
+    for _priority, (_key, _value) in enumerate(STATUS_MAP.items()):
+        _STATUS_AUTOMATON.add_word(_key, (_priority, _value))
+    _STATUS_AUTOMATON.make_automaton()
+else:
+    _STATUS_PATTERN = re.compile(
+        "(?=" + "|".join(f"(?P<k{i}>{re.escape(k)})" for i, k in enumerate(STATUS_MAP)) + ")"
+    )
+    _STATUS_VALUES = list(STATUS_MAP.values())
+
 
 def normalise_status(raw_status):
     """Normalise a raw status string from any portal to a dashboard status."""
     if not raw_status:
         return None
-    cleaned = raw_status.strip().lower()
-    for key, value in STATUS_MAP.items():
-        if key in cleaned:
-            return value
-    # If no match, return the original with title case
-    return raw_status.strip()
+    stripped = raw_status.strip()
+    # If no match, return the original string
+    return _match_status(stripped.lower()) or stripped
+
+
+@cache
+def _match_status(cleaned):
+    """Dashboard status for a lowercased portal status, or None if unmatched."""
+    if HAS_AHOCORASICK:
+        # Matches are (end_index, (priority, value)); lowest priority index wins
+        best = min((m[1] for m in _STATUS_AUTOMATON.iter(cleaned)), default=None)
+        if best:
+            return best[1]
+    else:
+        # Each position yields its highest-priority key; take the best overall
+        best = min((int(m.lastgroup[1:]) for m in _STATUS_PATTERN.finditer(cleaned)), default=None)
+        if best is not None:
+            return _STATUS_VALUES[best]
+    return None
+
+
+# Fast paths for the two dominant formats: ISO dates/datetimes from the
+# Agile API ("2026-02-11", "2025-12-15T00:00:00") and ePlanning's "11/02/2026"
+_ISO_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:$|T)")
+_DMY_RE = re.compile(r"^(\d{2})/(\d{2})/(\d{4})$")
+
+# Slower formats, tried in order only when neither fast path matches
+_DATE_FORMATS = [
+    "%d %b %Y",      # 11 Feb 2026
+    "%d/%m/%Y",       # 1/2/2026
+    "%Y-%m-%d",       # 2026-2-1
+    "%d %B %Y",       # 11 February 2026
+    "%d-%m-%Y",       # 11-02-2026
+]
 
 
 def parse_date(date_str):
     """Parse various Irish date formats to ISO YYYY-MM-DD."""
     if not date_str or date_str.strip() in ("", "-", "N/A", "None"):
         return None
-    date_str = date_str.strip()
-
-    # Handle ISO datetime from Agile API (e.g. "2025-12-15T00:00:00")
-    if "T" in date_str:
+    return _parse_date_cached(date_str.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str):
+    """Uncached parse_date body; date strings recur heavily within a run."""
+    m = _ISO_RE.match(date_str)
+    if m:
+        year, month, day = m.groups()
+    else:
+        m = _DMY_RE.match(date_str)
+        if m:
+            day, month, year = m.groups()
+    if m:
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "")).strftime("%Y-%m-%d")
-        except (ValueError, AttributeError):
-            pass
+            return datetime(int(year), int(month), int(day)).strftime("%Y-%m-%d")
+        except ValueError:
+            return None
 
-    # Try various date formats
-    formats = [
-        "%d %b %Y",      # 11 Feb 2026
-        "%d/%m/%Y",       # 11/02/2026
-        "%Y-%m-%d",       # 2026-02-11
-        "%d %B %Y",       # 11 February 2026
-        "%d-%m-%Y",       # 11-02-2026
-    ]
-    for fmt in formats:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
         except ValueError:
@@ -178,69 +355,278 @@ def parse_date(date_str):
 #   - Angular table rows have ng-click="$ctrl.actionClickRow(row)"
 #   - scope.row contains the full JSON: {id, reference, status, applicantSurname,
 #     registrationDate, decisionDate, finalGrantDate, location, proposal, ...}
+#   - The SPA loads those rows from the JSON API (see AgileApiClient):
+#     {api_url}/api/application/search?reference=25/6796&openApplications=false
+#     with x-client/x-product/x-service headers selecting the council
 #   - Detail page: /corkcoco/application-details/{id}
 #   - Detail page has form textboxes with labels for all fields
 
-class AgilePortalScraper:
-    """Scrapes the Agile Applications Citizen Portal using Playwright."""
+# Only documents, scripts and XHRs matter for scope.row and the detail form,
+# so everything else is aborted. Requests to hosts outside the portal's own
+# domains (analytics, trackers, map tiles) are aborted too.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet", "manifest", "texttrack", "other"})
+_ALLOWED_HOSTS = ("agileapplications.ie",)
 
-    def __init__(self, portal_config, playwright_browser=None):
-        self.base_url = portal_config["base_url"]
-        self.browser = playwright_browser
-        self.page = None
 
-    def _ensure_page(self):
-        """Create a browser page if we don't have one."""
-        if self.page is None:
-            self.page = self.browser.new_page()
+def _block_nonessential(route):
+    """Playwright route handler: abort requests the scraper doesn't need."""
+    request = route.request
+    host = urlparse(request.url).hostname or ""
+    allowed_host = any(host == h or host.endswith("." + h) for h in _ALLOWED_HOSTS)
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or not allowed_host:
+        route.abort()
+    else:
+        route.continue_()
 
-    def scrape_application(self, ref):
-        """Scrape a single application by reference number."""
-        self._ensure_page()
 
-        # Build the search URL with criteria
-        criteria = json.dumps({"openApplications": False, "reference": ref})
-        search_url = f"{self.base_url}/search-applications/results?criteria={criteria}&page=1"
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".hwp_scraper_profile")
 
-        print(f"  Loading Agile portal: {self.base_url}", file=sys.stderr)
-        print(f"  Searching for {ref}...", file=sys.stderr)
 
+class ContextPool:
+    """
+    Isolated Playwright browser contexts, one per worker thread.
+
+    Playwright's sync API is bound to the thread that started it, so one
+    browser can't be handed between ThreadPoolExecutor workers. Instead each
+    thread lazily launches its own persistent context on first acquire(),
+    and must release() it from the same thread when it is done.
+
+    Each context gets a numbered profile directory under `profile_dir` that
+    survives across runs, so the SPA's compiled JS and HTTP cache stay warm.
+    Chromium refuses to open a profile another browser has open, so each
+    slot is claimed with a lock file (worker-N.lock) that other threads and
+    other scraper processes respect; a slot held elsewhere is skipped for
+    the next free number. Where file locks aren't available (no fcntl, i.e.
+    Windows) each context uses a throwaway temporary profile instead.
+
+    If `cdp_url` is given, threads instead connect to an already-running
+    browser (see launch_shared_browser.py) and open a fresh context in it;
+    release() then closes only that context and leaves the browser running.
+
+    A failed launch is logged and acquire() returns None, so callers treat
+    it like having no browser; that thread doesn't try to launch again.
+    """
+
+    def __init__(self, size=4, profile_dir=PROFILE_DIR, cdp_url=None):
+        self.size = size
+        self.profile_dir = profile_dir
+        self.cdp_url = cdp_url
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._free_slots = list(range(size))
+        self._next_slot = size
+
+    def _lock_profile(self, index):
+        """Lock slot `index` for this process; returns the lock fd, or None if held."""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        fd = os.open(os.path.join(self.profile_dir, f"worker-{index}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
         try:
-            self.page.goto(search_url, wait_until="networkidle", timeout=30000)
-            # Wait for Angular to render the table
-            self.page.wait_for_selector("tr[ng-click]", timeout=15000)
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return None
+        return fd
+
+    def _take_slot(self):
+        """Claim the lowest profile slot no other thread or process holds."""
+        with self._lock:
+            skipped = []
+            try:
+                while True:
+                    if self._free_slots:
+                        index = self._free_slots.pop(0)
+                    else:
+                        index = self._next_slot
+                        self._next_slot += 1
+                    lock_fd = self._lock_profile(index)
+                    if lock_fd is not None:
+                        return index, lock_fd
+                    # Held by another scraper process; it may free up later
+                    skipped.append(index)
+            finally:
+                self._free_slots.extend(skipped)
+                self._free_slots.sort()
+
+    def _return_slot(self, index, lock_fd, temp_dir):
+        """Give back a profile slot (or remove a temporary profile)."""
+        if lock_fd is not None:
+            os.close(lock_fd)  # closing the fd drops the flock
+        if index is not None:
+            with self._lock:
+                self._free_slots.append(index)
+                self._free_slots.sort()
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def acquire(self):
+        """Return the calling thread's page, starting a browser if needed; None if that failed."""
+        slot = getattr(self._local, "slot", None)
+        if slot is not None:
+            return slot[-1]
+        if getattr(self._local, "failed", False):
+            return None
+
+        index = lock_fd = temp_dir = playwright = None
+        try:
+            playwright = sync_playwright().start()
+            if self.cdp_url:
+                log.info(f"  Connecting to shared browser at {self.cdp_url}...")
+                browser = playwright.chromium.connect_over_cdp(self.cdp_url)
+                context = browser.new_context(
+                    user_agent=USER_AGENT,
+                    viewport={"width": 1920, "height": 1080},
+                )
+            else:
+                log.info("  Starting headless browser...")
+                if HAS_FCNTL:
+                    index, lock_fd = self._take_slot()
+                    user_data_dir = os.path.join(self.profile_dir, f"worker-{index}")
+                else:
+                    user_data_dir = temp_dir = tempfile.mkdtemp(prefix="hwp_scraper_profile-")
+                context = playwright.chromium.launch_persistent_context(
+                    user_data_dir=user_data_dir,
+                    headless=True,
+                    args=["--disable-blink-features=AutomationControlled"],
+                    user_agent=USER_AGENT,
+                    viewport={"width": 1920, "height": 1080},
+                )
+            context.route("**/*", _block_nonessential)
+            page = context.pages[0] if context.pages else context.new_page()
         except Exception as e:
-            print(f"  [WARNING] Page load/render failed: {e}", file=sys.stderr)
+            log.warning(f"  [WARNING] Browser launch failed: {e}")
+            if playwright:
+                try:
+                    playwright.stop()
+                except Exception:
+                    pass
+            self._return_slot(index, lock_fd, temp_dir)
+            self._local.failed = True
             return None
 
-        # Extract data from Angular scope
+        self._local.slot = (index, lock_fd, temp_dir, playwright, context, page)
+        return page
+
+    def release(self):
+        """Close the calling thread's browser, if it started one."""
+        self._local.failed = False
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            return
+        self._local.slot = None
+        index, lock_fd, temp_dir, playwright, context, _page = slot
         try:
-            row_data = self.page.evaluate("""() => {
-                try {
-                    const row = document.querySelector('tr[ng-click]');
-                    if (!row) return null;
-                    const scope = angular.element(row).scope();
-                    const rowVar = scope.row || scope.$parent?.row;
-                    if (!rowVar) return null;
-                    # Return a clean copy (no Angular $$hashKey etc.)
-                    return JSON.parse(JSON.stringify(rowVar));
-                } catch(e) {
-                    return {error: e.message};
-                }
-            }""")
+            context.close()
+        finally:
+            # For a shared CDP browser this only disconnects; the browser stays up
+            playwright.stop()
+            self._return_slot(index, lock_fd, temp_dir)
+
+
+class AgileApiClient:
+    """
+    Queries the Agile Applications JSON API directly over HTTP.
+
+    The Citizen Portal SPA fetches its search results from this API, so
+    calling it ourselves returns the same row objects as scope.row without
+    launching Chromium or rendering Angular.
+    """
+
+    def __init__(self, portal_config):
+        self.api_url = portal_config["api_url"]
+        self.search_path = portal_config.get("search_path", "/api/application/search")
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept": "application/json",
+            # The API selects the council from these headers, as the SPA does
+            "x-client": portal_config.get("client", ""),
+            "x-product": "CITIZENPORTAL",
+            "x-service": "PA",
+        })
+
+    def search(self, ref):
+        """
+        Search for an application by reference.
+
+        Returns the list of result rows (possibly empty), or None if the API
+        is unreachable, auth-gated or returns an unexpected payload -- the
+        caller should then fall back to the browser.
+        """
+        url = f"{self.api_url}{self.search_path}"
+        log.info(f"  Querying Agile API for {ref}...")
+
+        try:
+            resp = self.session.get(url, params={"reference": ref, "openApplications": "false"}, timeout=10)
         except Exception as e:
-            print(f"  [WARNING] Angular scope extraction failed: {e}", file=sys.stderr)
+            log.warning(f"  [WARNING] Agile API request failed: {e}")
             return None
 
-        if not row_data or "error" in row_data:
-            print(f"  [INFO] No results found for {ref}", file=sys.stderr)
+        if resp.status_code != 200:
+            log.info(f"  [INFO] Agile API returned HTTP {resp.status_code}, falling back to browser")
             return None
 
-        # Verify the reference matches
-        if row_data.get("reference") != ref:
-            print(f"  [WARNING] Reference mismatch: expected {ref}, got {row_data.get('reference')}", file=sys.stderr)
+        try:
+            payload = resp.json()
+        except ValueError:
+            log.warning("  [WARNING] Agile API returned non-JSON response")
             return None
 
+        return agile_rows(payload)
+
+
+def agile_rows(payload):
+    """
+    Extract the result rows from an Agile search API payload.
+
+    The payload is either a bare list of rows or a paged
+    {"total": n, "results": [...]} envelope. Returns None for anything else.
+    """
+    rows = payload.get("results") if isinstance(payload, dict) else payload
+    if not isinstance(rows, list):
+        log.warning("  [WARNING] Unrecognised Agile API response shape")
+        return None
+    return rows
+
+
+class AgilePortalScraper:
+    """
+    Scrapes the Agile Applications Citizen Portal.
+
+    Searches go to the JSON API first. If that fails, the same API is called
+    from inside an already-loaded SPA (so the portal's own $http config and
+    auth apply), and only as a last resort is the results page rendered.
+    Detail pages are always rendered with Playwright.
+    """
+
+    def __init__(self, portal_config, context_pool=None):
+        self.base_url = portal_config["base_url"]
+        self.pool = context_pool
+        self.api = AgileApiClient(portal_config) if HAS_REQUESTS and portal_config.get("api_url") else None
+        self.api_search_url = (
+            f"{portal_config['api_url']}{portal_config.get('search_path', '/api/application/search')}"
+            if portal_config.get("api_url") else None
+        )
+
+    def _page(self):
+        """Return this thread's Playwright page, or None if there is no browser."""
+        return self.pool.acquire() if self.pool else None
+
+    def scrape_application(self, ref):
+        """Scrape a single application by reference number."""
+        rows = self.api.search(ref) if self.api else None
+        if rows is None:
+            rows = self._search_in_page(ref)
+
+        if rows is not None:
+            row_data = next((r for r in rows if r.get("reference") == ref), None)
+            if row_data is None:
+                log.info(f"  [INFO] No results found for {ref}")
+                return None
+        else:
+            row_data = self._search_in_browser(ref)
+            if row_data is None:
+                return None
+
         # Map Agile API fields to our standard format
         result = {
             "ref": row_data.get("reference", ref),
@@ -266,47 +652,202 @@ class AgilePortalScraper:
 
         return result
 
+    def _bootstrap(self, page):
+        """
+        Make sure `page` has this portal's Angular app loaded.
+
+        Any page already on the portal (e.g. the previous detail page) will
+        do, so the SPA bundle is only loaded once per page, not once per ref.
+        """
+        if page.url.startswith(self.base_url):
+            try:
+                if page.evaluate("() => typeof angular !== 'undefined'"):
+                    return True
+            except Exception:
+                pass
+
+        log.info(f"  Loading Agile portal: {self.base_url}")
+        try:
+            page.goto(f"{self.base_url}/search-applications", wait_until="domcontentloaded", timeout=15000)
+            page.wait_for_function(
+                "() => typeof angular !== 'undefined' && !!document.querySelector('.ng-scope')",
+                timeout=15000,
+            )
+        except Exception as e:
+            log.warning(f"  [WARNING] Portal bootstrap failed: {e}")
+            return False
+        return True
+
+    def _search_in_page(self, ref):
+        """Call the search API through the loaded SPA's own $http service."""
+        page = self._page()
+        if page is None or not self.api_search_url or not self._bootstrap(page):
+            return None
+
+        log.info(f"  Searching for {ref} via portal $http...")
+        try:
+            payload = page.evaluate("""async ([url, ref]) => {
+                try {
+                    // The app root carries the ng-scope class and the injector
+                    const root = document.querySelector('.ng-scope') || document.body;
+                    const $http = angular.element(root).injector().get('$http');
+                    const resp = await $http.get(url, {params: {reference: ref, openApplications: false}});
+                    return resp.data;
+                } catch (e) {
+                    return {error: (e && e.message) || ('HTTP ' + (e && e.status))};
+                }
+            }""", [self.api_search_url, ref])
+        except Exception as e:
+            log.warning(f"  [WARNING] In-page search failed: {e}")
+            return None
+
+        if isinstance(payload, dict) and "error" in payload:
+            log.warning(f"  [WARNING] In-page search failed: {payload['error']}")
+            return None
+        return agile_rows(payload)
+
+    def _is_search_response(self, response):
+        """Predicate for the SPA's own successful search API response."""
+        return response.url.startswith(self.api_search_url) and response.status == 200
+
+    def _search_in_browser(self, ref):
+        """
+        Load the SPA search results page and take the matching row.
+
+        The row is read from the search API response the SPA fetches, as
+        soon as it arrives; if that isn't observed, from the rendered
+        table's Angular scope instead.
+        """
+        page = self._page()
+        if page is None:
+            log.warning("  [WARNING] No browser available for Agile portal search")
+            return None
+
+        # Build the search URL with criteria
+        criteria = json.dumps({"openApplications": False, "reference": ref})
+        search_url = f"{self.base_url}/search-applications/results?criteria={criteria}&page=1"
+
+        log.info(f"  Loading Agile portal: {self.base_url}")
+        log.info(f"  Searching for {ref}...")
+
+        # Don't wait for networkidle -- the SPA's long-poll XHRs and analytics
+        # beacons keep it busy. The search response (or the rendered row) is
+        # the real readiness signal.
+        loaded = False
+        if self.api_search_url:
+            rows = None
+            try:
+                with page.expect_response(self._is_search_response, timeout=15000) as response_info:
+                    page.goto(search_url, wait_until="domcontentloaded", timeout=15000)
+                    loaded = True
+                rows = agile_rows(response_info.value.json())
+            except Exception as e:
+                log.info(f"  [INFO] Search response not captured ({e}), reading rendered table")
+            if rows is not None:
+                row_data = next((r for r in rows if r.get("reference") == ref), None)
+                if row_data is None:
+                    log.info(f"  [INFO] No results found for {ref}")
+                return row_data
+
+        try:
+            if not loaded:
+                page.goto(search_url, wait_until="domcontentloaded", timeout=15000)
+            # Wait for Angular to render the table
+            page.wait_for_selector("tr[ng-click]", timeout=15000)
+        except Exception as e:
+            log.warning(f"  [WARNING] Page load/render failed: {e}")
+            return None
+
+        # Fallback: extract data from Angular scope
+        try:
+            row_data = page.evaluate("""() => {
+                try {
+                    const row = document.querySelector('tr[ng-click]');
+                    if (!row) return null;
+                    const scope = angular.element(row).scope();
+                    const rowVar = scope.row || scope.$parent?.row;
+                    if (!rowVar) return null;
+                    // Return a clean copy (no Angular $$hashKey etc.)
+                    return JSON.parse(JSON.stringify(rowVar));
+                } catch(e) {
+                    return {error: e.message};
+                }
+            }""")
+        except Exception as e:
+            log.warning(f"  [WARNING] Angular scope extraction failed: {e}")
+            return None
+
+        if row_data and "error" in row_data:
+            log.warning(f"  [WARNING] Angular scope extraction failed: {row_data['error']}")
+            return None
+        if not row_data:
+            log.info(f"  [INFO] No results found for {ref}")
+            return None
+
+        # Verify the reference matches
+        if row_data.get("reference") != ref:
+            log.warning(f"  [WARNING] Reference mismatch: expected {ref}, got {row_data.get('reference')}")
+            return None
+
+        return row_data
+
     def _fetch_detail(self, app_id):
         """Fetch the detail page for additional fields not in search results."""
+        page = self._page()
+        if page is None:
+            return {}
+
         detail_url = f"{self.base_url}/application-details/{app_id}"
-        print(f"  Fetching detail page (ID: {app_id})...", file=sys.stderr)
+        log.info(f"  Fetching detail page (ID: {app_id})...")
 
         try:
-            self.page.goto(detail_url, wait_until="networkidle", timeout=30000)
+            page.goto(detail_url, wait_until="domcontentloaded", timeout=15000)
             # Wait for the form to load
-            self.page.wait_for_selector("label", timeout=10000)
-            time.sleep(1)  # Extra wait for Angular to populate form fields
+            page.wait_for_selector("label", timeout=10000)
         except Exception as e:
-            print(f"  [WARNING] Detail page load failed: {e}", file=sys.stderr)
+            log.warning(f"  [WARNING] Detail page load failed: {e}")
             return {}
 
-        # Extract form field values via JavaScript
+        # Wait (bounded) for Angular to populate the form fields, rather than
+        # a blind sleep. On timeout, extract whatever has rendered so far.
         try:
-            detail_data = self.page.evaluate("""() => {
-                const data = {};
-                const labels = document.querySelectorAll('label');
-                labels.forEach(label => {
-                    const labelText = label.textContent.trim();
+            page.wait_for_function(
+                """() => document.querySelectorAll('input[ng-model]').length > 3
+                    && Array.from(document.querySelectorAll('input')).some(i => i.value)""",
+                timeout=5000,
+            )
+        except Exception:
+            log.info("  [INFO] Form fields slow to populate, extracting anyway")
+
+        # Extract and classify form field values in one pass over the labels,
+        # so only the handful of fields we use cross back from the browser
+        try:
+            detail_data = page.evaluate("""() => {
+                const out = {};
+                document.querySelectorAll('label').forEach(label => {
+                    const text = label.textContent.trim().toLowerCase();
                     const forAttr = label.getAttribute('for');
                     let input = forAttr ? document.getElementById(forAttr) : null;
                     if (!input) input = label.parentElement?.querySelector('input, textarea');
-                    if (input && input.value && input.value !== '$ctrl.model') {
-                        data[labelText] = input.value;
+                    let value = input?.value;
+                    if (!value) {
+                        // Non-input display elements (used for Decision, Status description)
+                        const next = label.nextElementSibling;
+                        if (next && !next.matches('input, textarea, select')) value = next.textContent.trim();
                     }
+                    if (!value || value === '$ctrl.model') return;
+
+                    if (text.includes('submissions') || text.includes('observations')) out.subDue = value;
+                    else if (text.includes('decision due')) out.decDue = value;
+                    else if (text.includes('final grant')) out.grantDate = out.grantDate || value;
+                    else if (text === 'status') out.status = value;
+                    else if (text.includes('applicant')) out.client = value;
+                    else if (text.includes('eircode')) out.eircode = value;
                 });
-                # Also check for non-input display elements (used for Decision, Status description)
-                const genericLabels = document.querySelectorAll('label');
-                genericLabels.forEach(label => {
-                    const labelText = label.textContent.trim();
-                    const next = label.nextElementSibling;
-                    if (next && !next.matches('input, textarea, select') && next.textContent.trim()) {
-                        data[labelText + ' (display)'] = next.textContent.trim();
-                    }
-                });
-                return data;
+                return out;
             }""")
         except Exception as e:
-            print(f"  [WARNING] Detail extraction failed: {e}", file=sys.stderr)
+            log.warning(f"  [WARNING] Detail extraction failed: {e}")
             return {}
 
         if not detail_data:
@@ -314,32 +855,18 @@ class AgilePortalScraper:
 
         # Map detail fields
         result = {}
-        for key, value in detail_data.items():
-            key_lower = key.lower()
-            if "submissions" in key_lower or "observations" in key_lower:
-                result["subDue"] = parse_date(value)
-            elif "decision due" in key_lower:
-                result["decDue"] = parse_date(value)
-            elif "final grant" in key_lower:
-                if not result.get("grantDate"):
-                    result["grantDate"] = parse_date(value)
-            elif key_lower == "status":
-                if value and value != "$ctrl.model":
-                    result["status"] = normalise_status(value)
-                    result["raw_status"] = value
-            elif "applicant" in key_lower and value:
-                result["client"] = value
-            elif "eircode" in key_lower and value:
-                result["eircode"] = value
+        for field in ("subDue", "decDue", "grantDate"):
+            if detail_data.get(field):
+                result[field] = parse_date(detail_data[field])
+        if detail_data.get("status"):
+            result["status"] = normalise_status(detail_data["status"])
+            result["raw_status"] = detail_data["status"]
+        for field in ("client", "eircode"):
+            if detail_data.get(field):
+                result[field] = detail_data[field]
 
         return result
 
-    def close(self):
-        """Close the browser page."""
-        if self.page:
-            self.page.close()
-            self.page = None
-
 
 # =============================================================================
 # ePLANNING.IE SCRAPER (Limerick, and other legacy councils)
@@ -355,18 +882,95 @@ class AgilePortalScraper:
 #   - Further Info Requested/Received dates
 #   - Applicant name, Development Description, Development Address
 #   - Submissions By date
+#
+# Only <tr> rows are read, so <script>/<style> blocks and the large
+# __VIEWSTATE field are stripped with regexes, and only the span from the
+# first <table> to the last </table> is handed to the parser.
+
+_TABLES_RE = re.compile(r"<table\b.*</table>", re.S | re.I)
+_NOISE_RE = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<input[^>]*__VIEWSTATE[^>]*>", re.S | re.I)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.S | re.I)
+_NO_RESULTS_RE = re.compile(r"no results found", re.I)
+
 
 class EPlanningPortalScraper:
-    """Scrapes the ePlanning.ie portal using requests + BeautifulSoup."""
+    """Scrapes the ePlanning.ie portal using httpx (or requests) + BeautifulSoup."""
+
+    # C-backed lxml is several times faster than html.parser on these pages
+    _HTML_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+    # Label -> (result field, value converter). Exact labels are looked up
+    # directly; otherwise substrings are tried in order.
+    _EXACT_LABELS = {
+        "decision date": ("decDate", parse_date),
+    }
+    _LABEL_FIELDS = (
+        ("file number", "ref", None),
+        ("planning status", "status", normalise_status),
+        ("decision due", "decDue", parse_date),
+        ("decision type", "decisionOutcome", None),
+        ("received date", "regDate", parse_date),
+        ("applicant name", "client", None),
+        ("development address", "location", None),
+        ("development description", "proposal", None),
+        ("grant date", "grantDate", parse_date),
+        ("submissions by", "subDue", parse_date),
+        ("further info requested", "fi_requested", parse_date),
+        ("further info received", "fi_received", parse_date),
+    )
+
+    # Transient gateway errors are retried with exponential backoff
+    # (0.3s, 0.6s, 1.2s), whichever HTTP client is in use
+    _RETRY_STATUSES = (502, 503, 504)
+    _RETRIES = 3
+    _BACKOFF = 0.3
 
     def __init__(self, portal_config):
         self.base_url = portal_config["base_url"]
         self.detail_path = portal_config.get("detail_path", "/AppFileRefDetails")
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        headers = {
+            "User-Agent": USER_AGENT,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        })
+        }
+        # Shared by concurrent check_all workers, so keep-alive connections
+        # are pooled. With HTTP/2 (httpx + h2) those workers multiplex over a
+        # single connection to eplanning.ie.
+        if HAS_HTTPX:
+            self.client = httpx.Client(
+                headers=headers,
+                timeout=30.0,
+                follow_redirects=True,
+                # Transport retries cover connection failures only; status
+                # retries are done in _get()
+                transport=httpx.HTTPTransport(
+                    http2=HAS_H2,
+                    retries=self._RETRIES,
+                    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+                ),
+            )
+        else:
+            self.client = requests.Session()
+            self.client.headers.update(headers)
+            self.client.mount("https://", HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=self._RETRIES,
+                    backoff_factor=self._BACKOFF,
+                    status_forcelist=self._RETRY_STATUSES,
+                ),
+            ))
+
+    def _get(self, url):
+        """GET url, retrying transient gateway errors under httpx."""
+        if not HAS_HTTPX:
+            # The requests adapter already retries these statuses
+            return self.client.get(url, timeout=30)
+        for attempt in range(self._RETRIES + 1):
+            resp = self.client.get(url, timeout=30)
+            if resp.status_code not in self._RETRY_STATUSES or attempt == self._RETRIES:
+                return resp
+            time.sleep(self._BACKOFF * 2 ** attempt)
 
     def scrape_application(self, ref):
         """Scrape an application by reference from ePlanning.ie."""
@@ -375,16 +979,20 @@ class EPlanningPortalScraper:
         clean_ref = ref.replace("/", "")
         url = f"{self.base_url}{self.detail_path}/{clean_ref}/0"
 
-        print(f"  Fetching ePlanning page: {url}", file=sys.stderr)
+        log.info(f"  Fetching ePlanning page: {url}")
 
         try:
-            resp = self.session.get(url, timeout=30)
+            resp = self._get(url)
             resp.raise_for_status()
             return self._parse_detail_page(resp.text, ref)
         except Exception as e:
-            print(f"  [WARNING] ePlanning request failed: {e}", file=sys.stderr)
+            log.warning(f"  [WARNING] ePlanning request failed: {e}")
             return None
 
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.client.close()
+
     def _parse_detail_page(self, html, ref):
         """
         Parse an ePlanning.ie application detail page.
@@ -397,13 +1005,17 @@ class EPlanningPortalScraper:
           <td>Decision Due Date:</td><td>18/02/2026</td>
           etc.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        result = {"ref": ref}
-
         # Check for error page
-        if "no results found" in html.lower() or "error" in soup.title.string.lower() if soup.title else False:
+        title = _TITLE_RE.search(html)
+        if _NO_RESULTS_RE.search(html) or (title and "error" in title.group(1).lower()):
             return None
 
+        # Parse only the table region; fall back to the whole page if absent
+        stripped = _NOISE_RE.sub("", html)
+        tables = _TABLES_RE.search(stripped)
+        soup = BeautifulSoup(tables.group(0) if tables else stripped, self._HTML_PARSER)
+        result = {"ref": ref}
+
         # Extract all table rows with label-value pairs
         for row in soup.find_all("tr"):
             cells = row.find_all("td")
@@ -415,93 +1027,203 @@ class EPlanningPortalScraper:
                     continue
 
                 # Map ePlanning fields to our standard format
-                if "file number" in label:
-                    result["ref"] = value
-                elif "planning status" in label:
-                    result["status"] = normalise_status(value)
+                mapping = self._field_for_label(label)
+                if mapping is None:
+                    continue
+                field, convert = mapping
+                result[field] = convert(value) if convert else value
+                if field == "status":
                     result["raw_status"] = value
-                elif "decision due" in label:
-                    result["decDue"] = parse_date(value)
-                elif label == "decision date" or label == "decision date":
-                    result["decDate"] = parse_date(value)
-                elif "decision type" in label:
-                    result["decisionOutcome"] = value
-                elif "received date" in label:
-                    result["regDate"] = parse_date(value)
-                elif "applicant name" in label:
-                    result["client"] = value
-                elif "development address" in label:
-                    result["location"] = value
-                elif "development description" in label:
-                    result["proposal"] = value
-                elif "grant date" in label:
-                    result["grantDate"] = parse_date(value)
-                elif "submissions by" in label:
-                    result["subDue"] = parse_date(value)
-                elif "further info requested" in label and value:
-                    result["fi_requested"] = parse_date(value)
-                    # If FI was requested, override status
-                    if result.get("status") == "New Application" and parse_date(value):
-                        result["status"] = "Further Information Requested"
-                elif "further info received" in label and value:
-                    result["fi_received"] = parse_date(value)
+
+        # If FI was requested, override status
+        if result.get("fi_requested") and result.get("status") == "New Application":
+            result["status"] = "Further Information Requested"
 
         return result if len(result) > 1 else None
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _field_for_label(label):
+        """Return the (field, converter) for a table label, or None if unmapped."""
+        mapping = EPlanningPortalScraper._EXACT_LABELS.get(label)
+        if mapping:
+            return mapping
+        for key, field, convert in EPlanningPortalScraper._LABEL_FIELDS:
+            if key in label:
+                return field, convert
+        return None
+
+
+# =============================================================================
+# PORTAL RESPONSE CACHE
+# =============================================================================
+# Planning statuses change over days, not hours, so portal data fetched
+# recently can be reused instead of hitting the portal again. Applications
+# in a terminal status never change, so their entries never expire.
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".portal_cache.json")
+
+
+class PortalCache:
+    """
+    JSON-file cache of portal data, keyed by authority and reference.
+
+    Loaded once on construction and written back by flush(). Holds at most
+    `max_entries` entries, evicting the least recently fetched. Entries in a
+    terminal status change rarely, so they are kept for `terminal_ttl_hours`
+    rather than `ttl_hours`; the cap still lets a wrongly mapped terminal
+    status be re-fetched eventually.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl_hours=6, terminal_ttl_hours=24 * 7, max_entries=500):
+        self.path = path
+        self.ttl = timedelta(hours=ttl_hours)
+        self.terminal_ttl = timedelta(hours=terminal_ttl_hours)
+        self.max_entries = max_entries
+        self._entries = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            log.warning(f"  [WARNING] Ignoring unreadable cache {self.path}: {e}")
+
+    def get(self, auth, ref):
+        """Return cached portal data if still valid, else None."""
+        with self._lock:
+            entry = self._entries.get(f"{auth}|{ref}")
+        if not entry:
+            return None
+
+        ttl = self.terminal_ttl if entry.get("status") in TERMINAL_STATES else self.ttl
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, ValueError):
+            return None
+        if datetime.now() - fetched_at >= ttl:
+            return None
+
+        return {**entry["data"], "source": "cache"}
+
+    def put(self, auth, ref, data):
+        """Store freshly fetched portal data."""
+        key = f"{auth}|{ref}"
+        with self._lock:
+            # Re-insert so dict order tracks fetch order for eviction
+            self._entries.pop(key, None)
+            self._entries[key] = {
+                "data": data,
+                "fetched_at": datetime.now().isoformat(),
+                "status": data.get("status"),
+            }
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._dirty = True
+
+    def flush(self):
+        """Write the cache back to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(self._entries, f, default=str)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+            except OSError as e:
+                log.warning(f"  [WARNING] Could not write cache {self.path}: {e}")
+
 
 # =============================================================================
 # MAIN SCRAPER ORCHESTRATOR
 # =============================================================================
 
+# Fields (besides status) compared against the tracked values to detect changes
+CHANGE_FIELDS = ["decDue", "decDate", "grantDate", "client", "decisionOutcome", "subDue"]
+
+
 class HWPPortalScraper:
     """
     Main scraper that orchestrates checking all portals for all tracked
     applications, with fallback logic for dual-portal support.
     """
 
-    def __init__(self, portal_registry=None):
+    def __init__(self, portal_registry=None, workers=4, http_workers=8, cache=None,
+                 force_refresh=False, recheck_terminal=False):
         self.registry = portal_registry or PORTAL_REGISTRY
+        self.workers = workers
+        self.http_workers = http_workers
+        self.cache = cache if cache is not None else PortalCache()
+        self.force_refresh = force_refresh
+        self.recheck_terminal = recheck_terminal
         self._scrapers = {}
-        self._playwright = None
-        self._browser = None
+        self._lock = threading.Lock()
+        self._pool = None
 
     def _start_browser(self):
-        """Start Playwright browser for Agile portal scraping."""
+        """Set up the Playwright context pool for Agile portal scraping."""
         if not HAS_PLAYWRIGHT:
-            print("  [ERROR] Playwright not installed. Run: pip install playwright && playwright install chromium", file=sys.stderr)
+            log.error("  [ERROR] Playwright not installed. Run: pip install playwright && playwright install chromium")
             return False
-        if self._browser is None:
-            print("  Starting headless browser...", file=sys.stderr)
-            self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(headless=True)
+        if self._pool is None:
+            self._pool = ContextPool(self.workers, cdp_url=os.environ.get("HWP_SCRAPER_CDP_URL"))
         return True
 
     def _get_scraper(self, portal_config):
         """Get or create a scraper instance for a portal config."""
         key = portal_config["base_url"]
-        if key not in self._scrapers:
-            if portal_config["type"] == "agile":
-                if not self._start_browser():
-                    return None
-                self._scrapers[key] = AgilePortalScraper(portal_config, self._browser)
-            elif portal_config["type"] == "eplanning":
-                if not HAS_REQUESTS or not HAS_BS4:
-                    print("  [ERROR] requests/beautifulsoup4 not installed.", file=sys.stderr)
-                    return None
-                self._scrapers[key] = EPlanningPortalScraper(portal_config)
-            else:
-                raise ValueError(f"Unknown portal type: {portal_config['type']}")
-        return self._scrapers[key]
+        with self._lock:
+            if key not in self._scrapers:
+                if portal_config["type"] == "agile":
+                    # Without Playwright we can still search via the JSON API
+                    if not self._start_browser() and not HAS_REQUESTS:
+                        return None
+                    self._scrapers[key] = AgilePortalScraper(portal_config, self._pool)
+                elif portal_config["type"] == "eplanning":
+                    if not (HAS_HTTPX or HAS_REQUESTS) or not HAS_BS4:
+                        log.error("  [ERROR] httpx or requests, and beautifulsoup4, not installed.")
+                        return None
+                    self._scrapers[key] = EPlanningPortalScraper(portal_config)
+                else:
+                    raise ValueError(f"Unknown portal type: {portal_config['type']}")
+            return self._scrapers[key]
+
+    def _portal_type(self, auth):
+        """Return the primary portal type for an authority, or None if unknown."""
+        entry = self.registry.get(auth)
+        primary = entry.get("primary") if entry else None
+        return primary["type"] if primary else None
 
     def check_application(self, auth, ref):
         """
         Check an application's current status on the council portal.
-        Tries the primary portal first, falls back to secondary if available.
+        Uses cached portal data when still valid (unless force_refresh is set),
+        otherwise tries the primary portal first, then the fallback.
         """
         if auth not in self.registry:
-            print(f"  [WARNING] Unknown authority: {auth}", file=sys.stderr)
+            log.warning(f"  [WARNING] Unknown authority: {auth}")
             return None
 
+        if not self.force_refresh:
+            cached = self.cache.get(auth, ref)
+            if cached:
+                log.info(f"  Using cached portal data for {ref}")
+                return cached
+
+        result = self._check_portals(auth, ref)
+        if result:
+            self.cache.put(auth, ref, result)
+        return result
+
+    def _check_portals(self, auth, ref):
+        """Fetch an application from its primary portal, then its fallback."""
         entry = self.registry[auth]
 
         # Try primary portal
@@ -518,7 +1240,7 @@ class HWPPortalScraper:
         # Try fallback portal
         fallback = entry.get("fallback")
         if fallback:
-            print(f"  Primary portal failed, trying fallback...", file=sys.stderr)
+            log.info(f"  Primary portal failed, trying fallback...")
             scraper = self._get_scraper(fallback)
             if scraper:
                 result = scraper.scrape_application(ref)
@@ -533,99 +1255,207 @@ class HWPPortalScraper:
         """
         Check all tracked applications for status updates.
 
+        Agile applications are spread across up to `workers` threads, each
+        with its own browser context, and ePlanning applications across up
+        to `http_workers` threads sharing one HTTP session. Applications of
+        unknown authorities are handled on the calling thread. Applications
+        already in a terminal status are not fetched at all (marked
+        "skipped_terminal") unless recheck_terminal is set. Results keep the
+        order of `applications`.
+
         Args:
             applications: list of dicts with at least {auth, ref, status}
 
         Returns:
             list of dicts with updated fields and change indicators
         """
-        results = []
-
-        for app in applications:
-            auth = app.get("auth", "")
-            ref = app.get("ref", "")
-            current_status = app.get("status", "")
-
-            print(f"\nChecking {ref} ({auth})...", file=sys.stderr)
-
-            portal_data = self.check_application(auth, ref)
-
-            if portal_data is None:
-                results.append({
-                    **app,
-                    "_scrape_status": "failed",
-                    "_error": "Could not fetch from any portal",
-                })
+        flush_log()
+        results = [None] * len(applications)
+        jobs = {"agile": queue.Queue(), "eplanning": queue.Queue()}
+        other_jobs = []
+
+        for idx, app in enumerate(applications):
+            if app.get("status") in TERMINAL_STATES and not self.recheck_terminal:
+                results[idx] = {**app, "_scrape_status": "skipped_terminal"}
                 continue
+            portal_type = self._portal_type(app.get("auth", ""))
+            if portal_type in jobs:
+                jobs[portal_type].put((idx, app))
+            else:
+                other_jobs.append((idx, app))
 
-            # Determine if there are changes
-            changes = {}
-            new_status = portal_data.get("status")
-            if new_status and new_status != current_status:
-                changes["status"] = {
-                    "old": current_status,
-                    "new": new_status,
-                }
+        # Agile workers each hold a browser, so they are capped separately
+        # from the cheap HTTP-only ePlanning workers
+        n_workers = {
+            "agile": min(max(self.workers, 1), jobs["agile"].qsize()),
+            "eplanning": min(max(self.http_workers, 1), jobs["eplanning"].qsize()),
+        }
+        with ThreadPoolExecutor(max_workers=max(sum(n_workers.values()), 1)) as executor:
+            futures = [
+                executor.submit(self._drain, jobs[portal_type], results)
+                for portal_type, n in n_workers.items()
+                for _ in range(n)
+            ]
+            for idx, app in other_jobs:
+                results[idx] = self._check_one(app)
+                flush_log()
+            for future in futures:
+                future.result()
 
-            # Check for new/changed dates and fields
-            for field in ["decDue", "decDate", "grantDate", "client", "decisionOutcome", "subDue"]:
-                old_val = app.get(field)
-                new_val = portal_data.get(field)
-                if new_val and new_val != old_val:
-                    changes[field] = {"old": old_val, "new": new_val}
+        return results
 
-            results.append({
+    def _drain(self, jobs, results):
+        """Worker loop: check queued (index, app) jobs until the queue is empty."""
+        try:
+            while True:
+                try:
+                    idx, app = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                results[idx] = self._check_one(app)
+                flush_log()
+        finally:
+            flush_log()
+            if self._pool:
+                self._pool.release()
+
+    def _check_one(self, app):
+        """Check a single tracked application and build its result record."""
+        auth = app.get("auth", "")
+        ref = app.get("ref", "")
+        current_status = app.get("status", "")
+
+        log.info(f"\nChecking {ref} ({auth})...")
+
+        portal_data = self.check_application(auth, ref)
+
+        if portal_data is None:
+            return {
                 **app,
-                "_scrape_status": "success",
-                "_portal_data": portal_data,
-                "_changes": changes,
-                "_has_changes": len(changes) > 0,
-                "_source": portal_data.get("source", ""),
-            })
-
-        return results
+                "_scrape_status": "failed",
+                "_error": "Could not fetch from any portal",
+            }
+
+        # Determine if there are changes
+        changes = {}
+        new_status = portal_data.get("status")
+        if new_status and new_status != current_status:
+            changes["status"] = {
+                "old": current_status,
+                "new": new_status,
+            }
+
+        # Check for new/changed dates and fields
+        for field in CHANGE_FIELDS:
+            old_val = app.get(field)
+            new_val = portal_data.get(field)
+            if new_val and new_val != old_val:
+                changes[field] = {"old": old_val, "new": new_val}
+
+        return {
+            **app,
+            "_scrape_status": "success",
+            "_portal_data": portal_data,
+            "_changes": changes,
+            "_has_changes": len(changes) > 0,
+            "_source": portal_data.get("source", ""),
+        }
 
     def print_report(self, results):
         """Print a human-readable report of scrape results."""
-        print("\n" + "=" * 70, file=sys.stderr)
-        print("HWP PLANNING PORTAL SCRAPE REPORT", file=sys.stderr)
-        print(f"Date: {datetime.now().strftime('%d %B %Y %H:%M')}", file=sys.stderr)
-        print("=" * 70, file=sys.stderr)
+        log.info("\n" + "=" * 70)
+        log.info("HWP PLANNING PORTAL SCRAPE REPORT")
+        log.info(f"Date: {datetime.now().strftime('%d %B %Y %H:%M')}")
+        log.info("=" * 70)
 
         changed = [r for r in results if r.get("_has_changes")]
         failed = [r for r in results if r.get("_scrape_status") == "failed"]
         unchanged = [r for r in results if r.get("_scrape_status") == "success" and not r.get("_has_changes")]
+        skipped = [r for r in results if r.get("_scrape_status") == "skipped_terminal"]
 
         if changed:
-            print(f"\n--- STATUS CHANGES DETECTED ({len(changed)}) ---", file=sys.stderr)
+            log.info(f"\n--- STATUS CHANGES DETECTED ({len(changed)}) ---")
             for r in changed:
-                print(f"\n  {r['ref']} - {r.get('project', r.get('proposal', 'Unknown'))}", file=sys.stderr)
-                print(f"  Authority: {r['auth']}", file=sys.stderr)
+                log.info(f"\n  {r['ref']} - {r.get('project', r.get('proposal', 'Unknown'))}")
+                log.info(f"  Authority: {r['auth']}")
                 for field, change in r["_changes"].items():
-                    print(f"  {field}: {change['old']} -> {change['new']}", file=sys.stderr)
+                    log.info(f"  {field}: {change['old']} -> {change['new']}")
 
         if unchanged:
-            print(f"\n--- NO CHANGES ({len(unchanged)}) ---", file=sys.stderr)
+            log.info(f"\n--- NO CHANGES ({len(unchanged)}) ---")
             for r in unchanged:
-                print(f"  {r['ref']} - {r.get('status', 'Unknown')} (unchanged)", file=sys.stderr)
+                log.info(f"  {r['ref']} - {r.get('status', 'Unknown')} (unchanged)")
+
+        if skipped:
+            log.info(f"\n--- SKIPPED, TERMINAL STATUS ({len(skipped)}) ---")
+            for r in skipped:
+                log.info(f"  {r['ref']} - {r.get('status', 'Unknown')}")
 
         if failed:
-            print(f"\n--- FAILED TO CHECK ({len(failed)}) ---", file=sys.stderr)
+            log.info(f"\n--- FAILED TO CHECK ({len(failed)}) ---")
             for r in failed:
-                print(f"  {r['ref']} - {r.get('_error', 'Unknown error')}", file=sys.stderr)
+                log.info(f"  {r['ref']} - {r.get('_error', 'Unknown error')}")
 
-        print("\n" + "=" * 70, file=sys.stderr)
+        log.info("\n" + "=" * 70)
+        flush_log()
         return changed
 
     def close(self):
-        """Clean up browser resources."""
+        """Flush the portal cache and clean up browser resources."""
+        self.cache.flush()
         for scraper in self._scrapers.values():
             if hasattr(scraper, "close"):
                 scraper.close()
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
+        if self._pool:
+            # Worker threads release their own browsers; this covers any
+            # browser started on the calling thread (e.g. via a fallback).
+            self._pool.release()
+
+
+# =============================================================================
+# COLUMNAR RESULTS EXPORT
+# =============================================================================
+# check_all() results stay a list of dicts (the JSON/CSV outputs and
+# update_dashboard.py consume them). For historical diffing across runs they
+# can also be flattened into a typed, column-oriented pyarrow Table.
+
+DATE_FIELDS = ["regDate", "subDue", "decDue", "decDate", "grantDate"]
+
+
+def results_table(results):
+    """
+    Build a pyarrow Table from check_all() results, one row per application.
+
+    Dates are date32 columns holding the portal value (or the tracked value
+    if the portal had none), and each of status + CHANGE_FIELDS gets a
+    boolean `<field>_changed` mask column. Requires pyarrow.
+    """
+    def to_date(value):
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+    columns = {name: [] for name in ("ref", "auth", "project", "scrape_status", "source", "old_status", "new_status")}
+    columns.update({field: [] for field in DATE_FIELDS})
+    masks = {field: [] for field in ["status"] + CHANGE_FIELDS}
+
+    for r in results:
+        portal = r.get("_portal_data") or {}
+        changes = r.get("_changes") or {}
+        columns["ref"].append(r.get("ref"))
+        columns["auth"].append(r.get("auth"))
+        columns["project"].append(r.get("project"))
+        columns["scrape_status"].append(r.get("_scrape_status"))
+        columns["source"].append(r.get("_source"))
+        columns["old_status"].append(r.get("status"))
+        columns["new_status"].append(changes.get("status", {}).get("new", r.get("status")))
+        for field in DATE_FIELDS:
+            columns[field].append(to_date(portal.get(field) or r.get(field)))
+        for field, mask in masks.items():
+            mask.append(field in changes)
+
+    arrays = {name: pa.array(values, type=pa.string()) for name, values in columns.items() if name not in DATE_FIELDS}
+    arrays.update({field: pa.array(columns[field], type=pa.date32()) for field in DATE_FIELDS})
+    arrays.update({f"{field}_changed": pa.array(mask, type=pa.bool_()) for field, mask in masks.items()})
+    return pa.table(arrays)
 
 
 # =============================================================================
@@ -656,6 +1486,14 @@ DEFAULT_APPLICATIONS = [
 # CLI ENTRY POINT
 # =============================================================================
 
+# Underscore-prefixed result fields kept in --output json, with their defaults
+JSON_META_DEFAULTS = {
+    "_changes": {},
+    "_has_changes": False,
+    "_scrape_status": "unknown",
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="HWP Planning Portal Scraper - Check planning application statuses"
@@ -667,65 +1505,108 @@ def main():
         "--auth", type=str, help="Filter by authority name"
     )
     parser.add_argument(
-        "--output", choices=["text", "json", "csv"], default="text",
+        "--output", choices=["text", "json", "csv", "parquet"], default="text",
         help="Output format (default: text)"
     )
+    parser.add_argument(
+        "--parquet-path", type=str, default="scrape_results.parquet",
+        help="File written by --output parquet (default: scrape_results.parquet)"
+    )
     parser.add_argument(
         "--active-only", action="store_true",
         help="Only check active applications (skip Granted/Invalid)"
     )
+    parser.add_argument(
+        "--workers", type=int, default=4,
+        help="Number of concurrent browser contexts for Agile portals (default: 4)"
+    )
+    parser.add_argument(
+        "--recheck-terminal", action="store_true",
+        help="Also fetch applications already Granted/Invalid (skipped by default)"
+    )
+    parser.add_argument(
+        "--force-refresh", action="store_true",
+        help="Fetch every application from its portal, ignoring cached data"
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=6,
+        help="Hours before cached portal data for non-terminal applications expires (default: 6)"
+    )
+    parser.add_argument(
+        "--terminal-cache-ttl", type=float, default=24 * 7,
+        help="Hours before cached portal data for Granted/Invalid applications expires (default: 168)"
+    )
 
     args = parser.parse_args()
+    configure_logging()
 
     # Check dependencies
     if not HAS_PLAYWRIGHT:
-        print("WARNING: Playwright not installed. Agile portal scraping (Cork) will be skipped.", file=sys.stderr)
-        print("  Install: pip install playwright && playwright install chromium\n", file=sys.stderr)
-    if not HAS_REQUESTS or not HAS_BS4:
-        print("WARNING: requests/beautifulsoup4 not installed. ePlanning scraping (Limerick) will be skipped.", file=sys.stderr)
-        print("  Install: pip install requests beautifulsoup4\n", file=sys.stderr)
-
-    # Filter applications
-    apps = DEFAULT_APPLICATIONS
-
-    if args.ref:
-        apps = [a for a in apps if a["ref"] == args.ref]
-        if not apps:
-            print(f"Application {args.ref} not found in tracked list.", file=sys.stderr)
-            sys.exit(1)
-
-    if args.auth:
-        apps = [a for a in apps if args.auth.lower() in a["auth"].lower()]
+        log.warning("WARNING: Playwright not installed. Agile portal scraping (Cork) is limited to the JSON API search.")
+        log.info("  Install: pip install playwright && playwright install chromium\n")
+    if not (HAS_HTTPX or HAS_REQUESTS) or not HAS_BS4:
+        log.warning("WARNING: httpx/requests or beautifulsoup4 not installed. ePlanning scraping (Limerick) will be skipped.")
+        log.info("  Install: pip install requests beautifulsoup4 lxml\n")
+
+    if args.output == "parquet" and not HAS_PYARROW:
+        log.error("  [ERROR] pyarrow not installed. --output parquet needs: pip install pyarrow")
+        sys.exit(1)
+
+    # Filter applications in a single pass
+    ref_filter = args.ref
+    auth_filter = args.auth.lower() if args.auth else None
+    apps = [
+        a for a in DEFAULT_APPLICATIONS
+        if (not ref_filter or a["ref"] == ref_filter)
+        and (not auth_filter or auth_filter in a["auth"].lower())
+        and (not args.active_only or a["status"] not in TERMINAL_STATES)
+    ]
 
-    if args.active_only:
-        apps = [a for a in apps if a["status"] not in ("Final Grant Issued", "Invalid")]
+    if ref_filter and not apps:
+        log.info(f"Application {ref_filter} not found in tracked list (or excluded by --auth/--active-only).")
+        sys.exit(1)
 
     # Run scraper
-    scraper = HWPPortalScraper()
+    scraper = HWPPortalScraper(
+        workers=args.workers,
+        cache=PortalCache(ttl_hours=args.cache_ttl, terminal_ttl_hours=args.terminal_cache_ttl),
+        force_refresh=args.force_refresh,
+        recheck_terminal=args.recheck_terminal,
+    )
     try:
         results = scraper.check_all(apps)
 
         if args.output == "json":
             clean = []
             for r in results:
-                entry = {k: v for k, v in r.items() if not k.startswith("_")}
-                entry["_changes"] = r.get("_changes", {})
-                entry["_has_changes"] = r.get("_has_changes", False)
-                entry["_scrape_status"] = r.get("_scrape_status", "unknown")
+                # Drop internal bookkeeping but keep the fields update_dashboard reads
+                entry = r.copy()
+                for k in [k for k in entry if k.startswith("_") and k not in JSON_META_DEFAULTS]:
+                    del entry[k]
+                for k, default in JSON_META_DEFAULTS.items():
+                    entry.setdefault(k, default)
                 clean.append(entry)
             print(json.dumps(clean, indent=2, default=str))
         elif args.output == "csv":
-            print("ref,project,auth,old_status,new_status,change_detected,source")
-            for r in results:
-                changes = r.get("_changes", {})
-                new_status = changes.get("status", {}).get("new", "")
-                print(f'{r["ref"]},{r.get("project","")},{r["auth"]},{r["status"]},{new_status},{r.get("_has_changes",False)},{r.get("_source","")}')
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(["ref", "project", "auth", "old_status", "new_status", "change_detected", "source"])
+            writer.writerows(
+                (
+                    r["ref"], r.get("project", ""), r["auth"], r["status"],
+                    r.get("_changes", {}).get("status", {}).get("new", ""),
+                    r.get("_has_changes", False), r.get("_source", ""),
+                )
+                for r in results
+            )
+        elif args.output == "parquet":
+            pq.write_table(results_table(results), args.parquet_path)
+            log.info(f"Wrote {len(results)} result(s) to {args.parquet_path}")
         else:
             changed = scraper.print_report(results)
             if changed:
-                print(f"\n{len(changed)} application(s) have status changes.", file=sys.stderr)
+                log.info(f"\n{len(changed)} application(s) have status changes.")
             else:
-                print("\nNo status changes detected.", file=sys.stderr)
+                log.info("\nNo status changes detected.")
     finally:
         scraper.close()
 
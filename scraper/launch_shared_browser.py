@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+launch_shared_browser.py
+========================
+Starts one long-running headless Chromium that several scraper processes
+can share over the Chrome DevTools Protocol, instead of each process
+launching (and paying the startup and memory cost of) its own browser.
+
+Usage:
+  python scraper/launch_shared_browser.py              # Listen on port 9222
+  python scraper/launch_shared_browser.py --port 9333
+
+Then, in each scraper process:
+  export HWP_SCRAPER_CDP_URL=http://127.0.0.1:9222
+  python scraper/hwp_portal_scraper.py
+
+Each scraper worker opens its own context in the shared browser and closes
+it when done; the browser keeps running until this script is stopped (Ctrl+C).
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:
+    print("Playwright not installed. Run: pip install playwright && playwright install chromium", file=sys.stderr)
+    sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Launch a shared headless Chromium for HWP portal scrapers"
+    )
+    parser.add_argument(
+        "--port", type=int, default=9222, help="Remote debugging port (default: 9222)"
+    )
+    args = parser.parse_args()
+
+    # Use the Chromium build Playwright installed, so the CDP protocol matches
+    with sync_playwright() as p:
+        executable = p.chromium.executable_path
+
+    user_data_dir = tempfile.mkdtemp(prefix="hwp-shared-browser-")
+    proc = subprocess.Popen([
+        executable,
+        "--headless=new",
+        f"--remote-debugging-port={args.port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={user_data_dir}",
+        "--disable-blink-features=AutomationControlled",
+        "--no-first-run",
+        "about:blank",
+    ])
+
+    print(f"Shared browser running (pid {proc.pid}). Point scrapers at it with:")
+    print(f"  export HWP_SCRAPER_CDP_URL=http://127.0.0.1:{args.port}")
+
+    try:
+        sys.exit(proc.wait())
+    except KeyboardInterrupt:
+        proc.terminate()
+        proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,95 +13,297 @@ This script is designed to run in a GitHub Actions workflow:
 
 Usage:
   python scraper/update_dashboard.py
+  HWP_SCRAPER_FORCE_REFRESH=1 python scraper/update_dashboard.py   # Ignore cached portal data
 
 Exit codes:
   0 - Success (changes applied or no changes needed)
   1 - Error
 """
 
+import hashlib
 import json
 import re
 import subprocess
 import sys
 import os
+import threading
 from datetime import datetime
 
+# Optional imports -- graceful fallback if not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Summary already notes FI, e.g. "Further information requested." (case-insensitive)
+_FI_MENTIONED_RE = re.compile(r'further information[^"]*requested', re.I)
+
+
+def _loads(data):
+    """Parse JSON, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj):
+    """Serialise obj as indented UTF-8 JSON bytes, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def results_key(results):
+    """Stable content hash of the scraper results, used as the summary's cache key."""
+    payload = json.dumps(results, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def write_changes_summary(changes_path, summary, key):
+    """
+    Write .scraper_changes.json unless it already holds the summary for
+    these exact results. Re-running on unchanged results then leaves the
+    file (and its timestamp) alone. Returns True if the file was written.
+    """
+    try:
+        with open(changes_path, "rb") as f:
+            if _loads(f.read()).get("key") == key:
+                return False
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    with open(changes_path, "wb") as f:
+        f.write(_dumps({**summary, "key": key}))
+    return True
+
 
 def run_scraper():
     """Run the portal scraper and return parsed JSON results."""
     scraper_path = os.path.join(os.path.dirname(__file__), "hwp_portal_scraper.py")
 
+    cmd = [sys.executable, scraper_path, "--active-only", "--output", "json"]
+    if os.environ.get("HWP_SCRAPER_FORCE_REFRESH", "").lower() in ("1", "true", "yes"):
+        cmd.append("--force-refresh")
+
     print("Running portal scraper...")
-    result = subprocess.run(
-        [sys.executable, scraper_path, "--active-only", "--output", "json"],
-        capture_output=True,
-        text=True,
-        timeout=600,  # 10 minute timeout
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=-1,
     )
 
-    if result.returncode != 0:
-        print(f"Scraper stderr:\n{result.stderr}", file=sys.stderr)
+    # Stream scraper progress as it happens; collect stdout for parsing.
+    # The scraper writes its log to stderr once per finished application,
+    # so progress shows up here application by application.
+    # stdout stays as bytes -- the JSON parsers take UTF-8 bytes directly,
+    # so only the stderr lines we actually print get decoded.
+    chunks = []
+
+    def _relay_stderr():
+        for line in proc.stderr:
+            sys.stderr.write(line.decode("utf-8", errors="replace"))
+            sys.stderr.flush()
+
+    def _collect_stdout():
+        for chunk in iter(lambda: proc.stdout.read(65536), b""):
+            chunks.append(chunk)
+
+    readers = [
+        threading.Thread(target=_relay_stderr, daemon=True),
+        threading.Thread(target=_collect_stdout, daemon=True),
+    ]
+    for t in readers:
+        t.start()
+
+    try:
+        returncode = proc.wait(timeout=600)  # 10 minute timeout
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for t in readers:
+            t.join()
+
+    if returncode != 0:
+        print(f"Scraper exited with code {returncode}", file=sys.stderr)
         # Don't fail -- partial results may still be useful
 
     # Extract JSON from stdout
     # The scraper may print progress messages to stdout before the JSON,
     # so we need to find and extract the JSON array from the output
-    stdout = result.stdout.strip()
+    stdout = b"".join(chunks).strip()
     if not stdout:
         print("No output from scraper.")
         return []
 
     # Try direct parse first
     try:
-        return json.loads(stdout)
+        return _loads(stdout)
     except json.JSONDecodeError:
         pass
 
     # Look for JSON array in the output (starts with '[')
-    json_start = stdout.rfind('[')
+    json_start = stdout.rfind(b'[')
     if json_start >= 0:
         try:
-            return json.loads(stdout[json_start:])
+            return _loads(stdout[json_start:])
         except json.JSONDecodeError:
             pass
 
     # Look for JSON object (starts with '{')
-    json_start = stdout.find('{')
+    json_start = stdout.find(b'{')
     if json_start >= 0:
         try:
-            data = json.loads(stdout[json_start:])
+            data = _loads(stdout[json_start:])
             return [data] if isinstance(data, dict) else data
         except json.JSONDecodeError:
             pass
 
     print(f"Failed to parse scraper output.", file=sys.stderr)
-    print(f"Raw output: {stdout[:500]}", file=sys.stderr)
+    print(f"Raw output: {stdout[:500].decode('utf-8', errors='replace')}", file=sys.stderr)
     return []
 
 
-def find_and_update_entry(html, ref, changes):
+_QUOTE, _BACKSLASH, _OPEN_BRACE, _CLOSE_BRACE = b'"\\{}'
+
+
+def _entry_end(buf, start):
+    """
+    Return the offset just past the '}' that closes the object opened at
+    buf[start]. Quoted strings are skipped so braces inside a summary or
+    proposal don't upset the count.
     """
-    Find the DEFAULT_DATA entry for a given ref and update changed fields.
+    depth = 0
+    i = start
+    n = len(buf)
+    while i < n:
+        ch = buf[i]
+        if ch == _QUOTE:
+            i += 1
+            while i < n and buf[i] != _QUOTE:
+                i += 2 if buf[i] == _BACKSLASH else 1
+        elif ch == _OPEN_BRACE:
+            depth += 1
+        elif ch == _CLOSE_BRACE:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return -1
+
+
+def locate_entry(buf, ref):
+    """
+    Find the DEFAULT_DATA entry for a ref with a plain substring search
+    over the raw index.html bytes.
 
-    The entries look like:
-      {auth:"Cork County Council",...,ref:"25/6796",...,status:"New Application",...},
+    Returns (start, end) where buf[start:end] is the full
+    {auth:"...",...,ref:"25/6796",...} object, or None if it isn't there.
+    """
+    needle = f'ref:"{ref}"'.encode("utf-8")
+    pos = buf.find(needle)
+    # Only count ref as a key, not as text inside another field
+    while pos > 0 and buf[pos - 1] not in b"{,":
+        pos = buf.find(needle, pos + len(needle))
+    if pos < 0:
+        return None
+
+    start = buf.rfind(b"{", 0, pos)
+    end = _entry_end(buf, start) if start >= 0 else -1
+    if end < pos:
+        return None
+    return start, end
+
+
+def build_entry_index(buf, refs):
+    """
+    Map each ref that has changes to its entry span. Only those refs are
+    looked up, so the rest of the document is never walked.
+    """
+    index = {}
+    for ref in refs:
+        if ref not in index:
+            span = locate_entry(buf, ref)
+            if span:
+                index[ref] = span
+    return index
+
+
+def parse_entry_fields(entry):
+    """
+    Tokenise a single entry into {field: (value_start, value_end)}.
+
+    Values are quoted strings (with backslash escapes) or bare literals
+    such as null/true/false or a number. Offsets are into entry, so a
+    value can be replaced without searching for it again.
+    """
+    fields = {}
+    n = len(entry)
+    i = entry.find("{") + 1
+    while i < n:
+        ch = entry[i]
+        if not (ch.isalpha() or ch == "_"):
+            i += 1
+            continue
 
-    We use regex to find the entry by ref, then replace specific field values.
+        name_start = i
+        while i < n and (entry[i].isalnum() or entry[i] == "_"):
+            i += 1
+        if i >= n or entry[i] != ":":
+            continue
+        name = entry[name_start:i]
+        i += 1
+
+        value_start = i
+        if i < n and entry[i] == '"':
+            i += 1
+            while i < n and entry[i] != '"':
+                i += 2 if entry[i] == "\\" else 1
+            i += 1
+        else:
+            while i < n and entry[i] not in ",}":
+                i += 1
+        fields.setdefault(name, (value_start, i))
+    return fields
+
+
+def splice(text, edits):
     """
-    # Escape the ref for regex (handle slashes)
-    escaped_ref = re.escape(ref)
+    Apply (start, end, replacement) edits to text in one forward pass.
 
-    # Find the line containing this ref
-    # Pattern: matches from { to the next }, capturing the full entry
-    pattern = rf'(\{{[^}}]*ref:"{escaped_ref}"[^}}]*\}})'
-    match = re.search(pattern, html)
+    Offsets are all relative to the original text and must not overlap,
+    so the result is built with a single join however many edits there are.
+    """
+    parts = []
+    pos = 0
+    for start, end, replacement in sorted(edits):
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
 
-    if not match:
-        print(f"  Could not find entry for ref {ref} in index.html")
-        return html, False
 
-    old_entry = match.group(1)
-    new_entry = old_entry
+def apply_entry_changes(entry, ref, changes, fi_mode=False):
+    """
+    Apply scraped changes to a single DEFAULT_DATA entry.
+
+    The entries look like:
+      {auth:"Cork County Council",...,ref:"25/6796",...,status:"New Application",...},
+
+    The entry is tokenised once and every rewrite is made against those
+    value spans in one splice. With fi_mode (status moved to Further
+    Information Requested) the same pass also notes FI in the summary and
+    clears decDue, since FI pauses the statutory decision clock.
+
+    Only the entry slice is touched; the caller splices it back into the
+    document. Returns (new_entry, updated).
+    """
+    fields = parse_entry_fields(entry)
+    edits = {}
 
     applied = []
 
@@ -119,70 +321,26 @@ def find_and_update_entry(html, ref, changes):
             # String value -- escape quotes
             val_str = f'"{new_val}"'
 
-        # Replace the field value in the entry
-        # Pattern: field:"old_value" or field:null
-        field_pattern = rf'{field}:(?:"[^"]*"|null|true|false)'
-        field_match = re.search(field_pattern, new_entry)
-
-        if field_match:
-            new_entry = new_entry[:field_match.start()] + f'{field}:{val_str}' + new_entry[field_match.end():]
+        if field in fields:
+            edits[field] = val_str
             applied.append(f"{field}: {change.get('old')} -> {new_val}")
         else:
             print(f"  Could not find field {field} in entry for {ref}")
 
-    if new_entry != old_entry:
-        html = html.replace(old_entry, new_entry)
-        return html, True
+    if not any(entry[slice(*fields[f])] != v for f, v in edits.items()):
+        return entry, False
 
-    return html, False
-
-
-def update_summary_for_fi(html, ref):
-    """
-    If status changed to Further Information Requested,
-    append a note to the summary field.
-    """
-    escaped_ref = re.escape(ref)
-    pattern = rf'(\{{[^}}]*ref:"{escaped_ref}"[^}}]*\}})'
-    match = re.search(pattern, html)
-    if not match:
-        return html
+    if fi_mode:
+        # Note FI in the summary unless it already mentions it
+        if "summary" in fields:
+            start, end = fields["summary"]
+            summary = entry[start:end]
+            if summary.startswith('"') and not _FI_MENTIONED_RE.search(summary):
+                edits["summary"] = '"' + summary[1:-1].rstrip(".") + '. Further information requested by the planning authority."'
+        if "decDue" in fields:
+            edits["decDue"] = "null"
 
-    entry = match.group(1)
-
-    # Check if summary already mentions FI
-    if "further information" in entry.lower() and "requested" in entry.lower():
-        return html
-
-    # Find summary field
-    summary_match = re.search(r'summary:"([^"]*)"', entry)
-    if summary_match:
-        old_summary = summary_match.group(1)
-        new_summary = old_summary.rstrip(".") + ". Further information requested by the planning authority."
-        new_entry = entry.replace(f'summary:"{old_summary}"', f'summary:"{new_summary}"')
-        html = html.replace(entry, new_entry)
-
-    return html
-
-
-def clear_decision_due_for_fi(html, ref):
-    """
-    When status changes to FI, clear the decDue field
-    (FI pauses the statutory decision clock).
-    """
-    escaped_ref = re.escape(ref)
-    pattern = rf'(\{{[^}}]*ref:"{escaped_ref}"[^}}]*\}})'
-    match = re.search(pattern, html)
-    if not match:
-        return html
-
-    entry = match.group(1)
-    # Replace decDue with null
-    new_entry = re.sub(r'decDue:"[^"]*"', 'decDue:null', entry)
-    if new_entry != entry:
-        html = html.replace(entry, new_entry)
-
-    return html
+    return splice(entry, [(*fields[f], v) for f, v in edits.items()]), True
 
 
 def main():
@@ -202,61 +360,76 @@ def main():
         sys.exit(0)
 
     # Filter to only results with changes
-    changed = [r for r in results if r.get("_has_changes")]
+    changed = [
+        (r.get("ref", ""), r.get("project", "Unknown"), r.get("_changes", {}))
+        for r in results if r.get("_has_changes")
+    ]
     failed = [r for r in results if r.get("_scrape_status") == "failed"]
 
     print(f"\nScraper results: {len(results)} checked, {len(changed)} changed, {len(failed)} failed")
 
+    key = results_key(results)
+    changes_path = os.path.join(repo_root, ".scraper_changes.json")
+
     if not changed:
         print("No changes detected. Dashboard is up to date.")
         # Write empty changes file for the workflow to check
-        changes_path = os.path.join(repo_root, ".scraper_changes.json")
-        with open(changes_path, "w") as f:
-            json.dump({"changes": [], "timestamp": datetime.now().isoformat()}, f)
+        write_changes_summary(changes_path, {"changes": [], "timestamp": datetime.now().isoformat()}, key)
         sys.exit(0)
 
-    # Read index.html
-    with open(index_path, "r", encoding="utf-8") as f:
-        html = f.read()
+    # Read index.html as bytes; only the entries being edited are decoded
+    with open(index_path, "rb") as f:
+        buf = bytearray(f.read())
+
+    # Locate each changed entry once, then edit slices rather than the whole document
+    index = build_entry_index(buf, (ref for ref, _, _ in changed))
+    edits = {}
 
     # Apply changes
     commit_lines = []
-    for r in changed:
-        ref = r.get("ref", "")
-        changes = r.get("_changes", {})
-        project = r.get("project", "Unknown")
-
+    for ref, project, changes in changed:
         print(f"\nUpdating {ref} ({project}):")
+        change_parts = []
         for field, change in changes.items():
-            print(f"  {field}: {change.get('old')} -> {change.get('new')}")
+            new_val = change.get("new")
+            print(f"  {field}: {change.get('old')} -> {new_val}")
+            change_parts.append(f"{field}: {new_val}")
 
-        html, updated = find_and_update_entry(html, ref, changes)
-
-        if updated:
-            change_summary = ', '.join(f'{k}: {v.get("new")}' for k, v in changes.items())
-            commit_lines.append(f"  - {ref} ({project}): {change_summary}")
+        if ref not in index:
+            print(f"  Could not find entry for ref {ref} in index.html")
+            continue
 
-            # Special handling for FI status
-            status_change = changes.get("status", {})
-            if status_change.get("new") == "Further Information Requested":
-                html = update_summary_for_fi(html, ref)
-                html = clear_decision_due_for_fi(html, ref)
+        start, end = index[ref]
+        # Special handling for FI status
+        fi_mode = "status" in changes and changes["status"].get("new") == "Further Information Requested"
+        entry, updated = apply_entry_changes(edits.get(ref) or buf[start:end].decode("utf-8"), ref, changes, fi_mode)
 
-    if commit_lines:
+        if updated:
+            commit_lines.append(f"  - {ref} ({project}): {', '.join(change_parts)}")
+            edits[ref] = entry
+
+    # Patch entries in place, back to front so earlier offsets stay valid
+    dirty = False
+    for start, end, entry in sorted(((*index[ref], entry) for ref, entry in edits.items()), reverse=True):
+        encoded = entry.encode("utf-8")
+        if buf[start:end] != encoded:
+            buf[start:end] = encoded
+            dirty = True
+
+    # Edits that leave every entry byte-identical don't need a write or a commit
+    if commit_lines and dirty:
         # Write updated index.html
-        with open(index_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        with open(index_path, "wb") as f:
+            f.write(buf)
         print(f"\nUpdated index.html with {len(commit_lines)} change(s).")
 
         # Write changes summary for commit message
-        changes_path = os.path.join(repo_root, ".scraper_changes.json")
         summary = {
             "changes": commit_lines,
             "timestamp": datetime.now().isoformat(),
             "commit_message": f"Auto-update: {len(commit_lines)} application status change(s)\n\n" + "\n".join(commit_lines),
         }
-        with open(changes_path, "w") as f:
-            json.dump(summary, f, indent=2)
+        write_changes_summary(changes_path, summary, key)
 
         print("\nCommit message:")
         print(summary["commit_message"])